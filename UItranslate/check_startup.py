@@ -0,0 +1,56 @@
+"""
+Kiểm tra hồi quy thời gian khởi động của VSIX Editor.
+
+Chạy vsix_editor.py trong tiến trình mới (cold start) ở chế độ thường và --lazy
+với --startup-time/--startup-budget; thoát mã 1 nếu mốc `ready` vượt ngưỡng.
+Bỏ qua (mã 0) khi không có màn hình để mở cửa sổ Tk.
+
+    python UItranslate/check_startup.py [--budget 1.5] [goi.vsix]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+EDITOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vsix_editor.py")
+
+
+def _has_display() -> bool:
+    try:
+        import tkinter
+        root = tkinter.Tk()
+        root.destroy()
+        return True
+    except Exception:
+        return False
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Kiểm tra thời gian khởi động VSIX Editor")
+    parser.add_argument("path", nargs="?", help="tệp .vsix mở kèm khi khởi động")
+    parser.add_argument("--budget", type=float, default=1.5, metavar="GIAY",
+                        help="ngưỡng cho mốc ready (mặc định 1.5 giây)")
+    args = parser.parse_args(argv)
+
+    if not _has_display():
+        print("check_startup: bỏ qua (không có màn hình cho Tk)")
+        return 0
+
+    failed = False
+    for mode in ([], ["--lazy"]):
+        cmd = [sys.executable, EDITOR, "--startup-time", "--startup-budget", str(args.budget), *mode]
+        if args.path:
+            cmd.append(args.path)
+        res = subprocess.run(cmd, capture_output=True, text=True)
+        label = "lazy" if mode else "thường"
+        print(f"[{label}] {res.stdout.strip()}")
+        if res.returncode != 0:
+            if res.stderr.strip():
+                print(res.stderr.strip(), file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,19 +10,50 @@ Tính năng:
 Lưu ý: MVP tinh gọn để hoạt động ngay. Có thể mở rộng theo nhu cầu.
 """
 
+import time
+_T_START = time.perf_counter()  # mốc đo thời gian khởi động (cold start)
+
+import argparse
+import hashlib
 import io
 import json
 import os
+import posixpath
 import re
+import struct
+import sys
 import zipfile
-from typing import Optional, Dict
-from tkinter import Tk, BOTH, LEFT, RIGHT, Y, X, StringVar, BooleanVar, END
+import zlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple, Callable, Iterable, Any, Iterator
+from tkinter import Tk, Toplevel, BOTH, LEFT, RIGHT, Y, X, StringVar, BooleanVar, END
 from tkinter import filedialog, messagebox, Scrollbar, Text
 from tkinter import ttk
-try:
-    import customtkinter as ctk
-except Exception:  # nếu chưa cài đặt, tiếp tục dùng tkinter thường
-    ctk = None
+
+# customtkinter được nạp trễ qua _load_ctk() (import khá nặng, không cần cho
+# các hàm xử lý VSIX thuần tuý; chế độ khởi động nhanh --lazy dùng ttk suốt phiên).
+ctk = None
+_ctk_tried = False
+
+
+def _load_ctk():
+    global ctk, _ctk_tried
+    if _ctk_tried:
+        return ctk
+    _ctk_tried = True
+    try:
+        import customtkinter as _ctk
+    except Exception:  # nếu chưa cài đặt, tiếp tục dùng tkinter thường
+        return None
+    ctk = _ctk
+    # set theme trước để áp dụng màu đồng nhất
+    try:
+        ctk.set_default_color_theme("blue")
+        ctk.set_appearance_mode("dark")
+    except Exception:
+        pass
+    return ctk
 
 
 JSON_EXTS = {".json", ".code-snippets"}
@@ -53,8 +84,567 @@ def file_category(path: str) -> str:
     return "khac"
 
 
+def read_vsix_members(path: str, errors: Optional[List[str]] = None) -> Dict[str, bytes]:
+    """Đọc toàn bộ tệp trong VSIX vào bộ nhớ: file_path -> bytes.
+
+    Tệp đọc lỗi (CRC sai, nén hỏng...) bị bỏ ra khỏi kết quả thay vì giữ nội
+    dung rỗng; lỗi và tên trùng được ghi vào `errors` nếu truyền vào.
+    """
+    files: Dict[str, bytes] = {}
+    with zipfile.ZipFile(path, "r") as zf:
+        names = zf.namelist()
+        if errors is not None:
+            errors.extend(check_member_names(names))
+        for n in names:
+            try:
+                files[n] = zf.read(n)
+            except Exception as e:
+                if errors is not None:
+                    errors.append(f"{n}: không đọc được ({e}), đã bỏ khỏi danh sách tệp")
+    return files
+
+
+# ------------------------- Verify -------------------------
+MANIFEST_NAME = "extension.vsixmanifest"
+CONTENT_TYPES_NAME = "[Content_Types].xml"
+
+
+def check_member_names(names: Iterable[str]) -> List[str]:
+    """Tên trùng lặp hoặc chỉ khác hoa/thường (lỗi khi giải nén trên Windows)."""
+    problems = []
+    exact = set()
+    seen: Dict[str, str] = {}
+    for n in names:
+        if n in exact:
+            problems.append(f"{n}: tên tệp bị trùng")
+            continue
+        exact.add(n)
+        key = n.lower()
+        prev = seen.get(key)
+        if prev is None:
+            seen[key] = n
+        else:
+            problems.append(f"{n}: trùng tên (khác hoa/thường) với {prev}")
+    return problems
+
+
+def _package_json_name(names) -> str:
+    # vsce đặt package.json trong extension/, bản tự đóng gói có thể ở gốc
+    return "extension/package.json" if "extension/package.json" in names else "package.json"
+
+
+def bump_patch_version(files: Dict[str, bytes]) -> Optional[str]:
+    """Tăng patch version trong package.json và Identity Version của manifest (sửa tại chỗ).
+
+    Trả về version mới, hoặc None nếu không có package.json / version không dạng x.y.z.
+    """
+    pkg_name = _package_json_name(files)
+    if pkg_name not in files:
+        return None
+    pkg = json.loads(files[pkg_name].decode("utf-8"))
+    m = re.match(r"^(\d+)\.(\d+)\.(\d+)$", str(pkg.get("version", "0.0.0")))
+    if not m:
+        return None
+    x, y, z = map(int, m.groups())
+    new_version = f"{x}.{y}.{z+1}"
+    pkg["version"] = new_version
+    files[pkg_name] = json.dumps(pkg, ensure_ascii=False, indent=2).encode("utf-8")
+    if MANIFEST_NAME in files:
+        # sửa thẳng thuộc tính để giữ nguyên định dạng manifest
+        text = files[MANIFEST_NAME].decode("utf-8")
+        text = re.sub(r'(<Identity\b[^>]*?\sVersion=")[^"]*(")',
+                      lambda mm: mm.group(1) + new_version + mm.group(2), text, count=1)
+        files[MANIFEST_NAME] = text.encode("utf-8")
+    return new_version
+
+
+def _xml_children(root, tag: str):
+    # bỏ qua namespace: {ns}Tag -> Tag
+    return [el for el in root.iter() if el.tag.rsplit("}", 1)[-1] == tag]
+
+
+def check_vsix_consistency(names: Iterable[str], read: Callable[[str], bytes]) -> List[str]:
+    """Đối chiếu extension.vsixmanifest, [Content_Types].xml và package.json với danh sách tệp."""
+    names = [n for n in names if not n.endswith("/")]
+    name_set = set(names)
+    problems = []
+
+    def load(name: str, parse):
+        if name not in name_set:
+            return None
+        try:
+            return parse(read(name))
+        except Exception as e:
+            problems.append(f"{name}: không phân tích được ({e})")
+            return None
+
+    # package.json
+    pkg_name = _package_json_name(name_set)
+    pkg = load(pkg_name, lambda b: json.loads(b.decode("utf-8-sig")))
+    if pkg_name not in name_set:
+        problems.append("Thiếu package.json")
+    pkg = pkg if isinstance(pkg, dict) else None
+
+    # extension.vsixmanifest
+    manifest = load(MANIFEST_NAME, ET.fromstring)
+    if MANIFEST_NAME not in name_set:
+        problems.append(f"Thiếu {MANIFEST_NAME}")
+    if manifest is not None:
+        for asset in _xml_children(manifest, "Asset"):
+            path = asset.get("Path")
+            if path and path not in name_set:
+                problems.append(f"{MANIFEST_NAME}: Asset {asset.get('Type')} trỏ tới tệp không có: {path}")
+        identity = _xml_children(manifest, "Identity")
+        if identity and pkg is not None:
+            ident = identity[0]
+            if pkg.get("version") is not None and ident.get("Version") != str(pkg.get("version")):
+                problems.append(f"{MANIFEST_NAME}: Version {ident.get('Version')} khác "
+                                f"{pkg_name} version {pkg.get('version')}")
+            if pkg.get("name") is not None and ident.get("Id") != pkg.get("name"):
+                problems.append(f"{MANIFEST_NAME}: Id {ident.get('Id')} khác {pkg_name} name {pkg.get('name')}")
+            if pkg.get("publisher") is not None and ident.get("Publisher") != pkg.get("publisher"):
+                problems.append(f"{MANIFEST_NAME}: Publisher {ident.get('Publisher')} khác "
+                                f"{pkg_name} publisher {pkg.get('publisher')}")
+
+    # [Content_Types].xml: mọi tệp phải có Default theo đuôi hoặc Override theo PartName
+    content_types = load(CONTENT_TYPES_NAME, ET.fromstring)
+    if CONTENT_TYPES_NAME not in name_set:
+        problems.append(f"Thiếu {CONTENT_TYPES_NAME}")
+    if content_types is not None:
+        # vsce ghi Extension=".json", chuẩn OPC ghi "json"
+        exts = {(el.get("Extension") or "").lower().lstrip(".") for el in _xml_children(content_types, "Default")}
+        parts = {(el.get("PartName") or "").lower() for el in _xml_children(content_types, "Override")}
+        missing = set()
+        for n in names:
+            if n == CONTENT_TYPES_NAME:
+                continue
+            ext = posixpath.splitext(posixpath.basename(n))[1][1:].lower()
+            if ext in exts and ext:
+                continue
+            if "/" + n.lower() in parts:
+                continue
+            missing.add(f".{ext}" if ext else n)
+        for m in sorted(missing):
+            problems.append(f"{CONTENT_TYPES_NAME}: không khai báo content type cho {m}")
+
+    # package.json: các đường dẫn trong contributes phải có trong gói
+    if pkg is not None:
+        base = posixpath.dirname(pkg_name)
+
+        def need(path, label):
+            if not isinstance(path, str) or not path:
+                return
+            full = posixpath.normpath(posixpath.join(base, path))
+            if full not in name_set:
+                problems.append(f"{pkg_name}: {label} trỏ tới tệp không có: {full}")
+
+        need(pkg.get("icon"), "icon")
+        contributes = pkg.get("contributes") or {}
+        for loc in contributes.get("localizations") or []:
+            for tr in (loc.get("translations") or []) if isinstance(loc, dict) else []:
+                if isinstance(tr, dict):
+                    need(tr.get("path"), f"localizations[{loc.get('languageId')}] {tr.get('id')}")
+    return problems
+
+
+def _check_crc_chunk(path: str, infos: List[zipfile.ZipInfo]) -> List[str]:
+    problems = []
+    with zipfile.ZipFile(path, "r") as zf:
+        for info in infos:
+            try:
+                # ZipExtFile tự so CRC khi đọc hết dữ liệu
+                with zf.open(info) as f:
+                    while f.read(1 << 20):
+                        pass
+            except Exception as e:
+                problems.append(f"{info.filename}: lỗi dữ liệu ({e})")
+    return problems
+
+
+def check_vsix_crcs(path: str, workers: Optional[int] = None) -> List[str]:
+    """Đọc lại mọi tệp trong VSIX và so CRC, chia đều cho nhiều luồng."""
+    with zipfile.ZipFile(path, "r") as zf:
+        infos = zf.infolist()
+    problems: List[str] = []
+
+    # Chia tệp theo dung lượng cho các luồng; zlib nhả GIL khi giải nén/tính CRC
+    workers = max(1, min(workers or os.cpu_count() or 1, len(infos)))
+    chunks: List[List[zipfile.ZipInfo]] = [[] for _ in range(workers)]
+    loads = [0] * workers
+    for info in sorted(infos, key=lambda i: i.compress_size, reverse=True):
+        k = loads.index(min(loads))
+        chunks[k].append(info)
+        loads[k] += info.compress_size
+    if workers == 1:
+        problems += _check_crc_chunk(path, chunks[0])
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for res in ex.map(lambda c: _check_crc_chunk(path, c), chunks):
+                problems += res
+    return problems
+
+
+def verify_vsix(path: str, workers: Optional[int] = None) -> List[str]:
+    """Kiểm tra toàn vẹn VSIX: tên trùng, tính nhất quán manifest và CRC từng tệp."""
+    try:
+        with zipfile.ZipFile(path, "r") as zf:
+            names = zf.namelist()
+            problems = check_member_names(names)
+            problems += check_vsix_consistency(names, zf.read)
+    except (zipfile.BadZipFile, OSError) as e:
+        return [f"{path}: không mở được VSIX ({e})"]
+    return problems + check_vsix_crcs(path, workers)
+
+
+def format_problems(problems: List[str], limit: int = 20) -> str:
+    text = "\n".join(f"- {p}" for p in problems[:limit])
+    if len(problems) > limit:
+        text += f"\n... và {len(problems) - limit} vấn đề khác"
+    return text
+
+
+# ------------------------- Bulk edit theo path -------------------------
+def iter_json_leaves(obj, prefix: str = "", tokens: tuple = ()) -> Iterator[Tuple[str, tuple, Any]]:
+    """Duyệt các giá trị lá: (path dạng a.b[0].c, tokens để ghi lại, value)."""
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            yield from iter_json_leaves(v, f"{prefix}.{k}" if prefix else str(k), tokens + (k,))
+    elif isinstance(obj, list):
+        for i, v in enumerate(obj):
+            yield from iter_json_leaves(v, f"{prefix}[{i}]", tokens + (i,))
+    else:
+        yield prefix, tokens, obj
+
+
+def get_json_tokens(obj, tokens: tuple):
+    for tk in tokens:
+        obj = obj[tk]
+    return obj
+
+
+def set_json_tokens(obj, tokens: tuple, value) -> None:
+    for tk in tokens[:-1]:
+        obj = obj[tk]
+    obj[tokens[-1]] = value
+
+
+def compile_path_pattern(pattern: str, use_regex: bool = False) -> Callable[[str], bool]:
+    """Biên dịch sẵn mẫu path: glob (phân biệt hoa/thường, khớp cả chuỗi) hoặc regex (search).
+
+    Glob chỉ coi `*` và `?` là ký tự đại diện; `[0]` được hiểu đúng nghĩa đen
+    để path chép từ lưới (a.b[0].c) dùng được ngay.
+    """
+    if use_regex:
+        return re.compile(pattern).search
+    parts = [".*" if c == "*" else "." if c == "?" else re.escape(c) for c in pattern]
+    return re.compile("".join(parts) + r"\Z", re.DOTALL).match
+
+
+_MISSING = object()
+
+
+def compile_value_transform(expr: str, reference: Optional[Dict[str, bytes]] = None):
+    """Biên dịch biểu thức giá trị thành hàm (member, tokens, value) -> giá trị mới.
+
+    Cú pháp:
+    - `=<giá trị>`: đặt giá trị (JSON nếu hợp lệ, ngược lại là chuỗi)
+    - `upper` / `lower` / `strip`
+    - `prefix:<text>` / `suffix:<text>`
+    - `replace:<cũ>=><mới>` / `re:<mẫu>=><thay>`
+    - `ref`: lấy giá trị cùng tệp + cùng path từ bản gốc (`reference`)
+    Biến đổi chuỗi bỏ qua giá trị không phải chuỗi. Trả về _MISSING nghĩa là giữ nguyên.
+    """
+    def on_str(fn):
+        return lambda member, tokens, v: fn(v) if isinstance(v, str) else _MISSING
+
+    def split_arrow(arg: str) -> Tuple[str, str]:
+        if "=>" not in arg:
+            raise ValueError(f"Thiếu '=>' trong biểu thức: {expr}")
+        old, new = arg.split("=>", 1)
+        return old, new
+
+    if expr.startswith("="):
+        text = expr[1:]
+        try:
+            value = json.loads(text)
+        except Exception:
+            value = text
+        return lambda member, tokens, v: value
+    if expr.strip() in ("upper", "lower", "strip"):
+        return on_str(getattr(str, expr.strip()))
+    if expr.startswith("prefix:"):
+        text = expr[len("prefix:"):]
+        return on_str(lambda v: text + v)
+    if expr.startswith("suffix:"):
+        text = expr[len("suffix:"):]
+        return on_str(lambda v: v + text)
+    if expr.startswith("replace:"):
+        old, new = split_arrow(expr[len("replace:"):])
+        return on_str(lambda v: v.replace(old, new))
+    if expr.startswith("re:"):
+        pat, repl = split_arrow(expr[len("re:"):])
+        rx = re.compile(pat)
+        return on_str(lambda v: rx.sub(repl, v))
+    if expr.strip() == "ref":
+        if reference is None:
+            raise ValueError("Chưa chọn bản gốc cho biểu thức 'ref'")
+        parsed: Dict[str, Any] = {}
+
+        def from_ref(member, tokens, v):
+            if member not in parsed:
+                try:
+                    parsed[member] = json.loads(reference[member].decode("utf-8"))
+                except Exception:
+                    parsed[member] = _MISSING
+            obj = parsed[member]
+            if obj is _MISSING:
+                return _MISSING
+            try:
+                return get_json_tokens(obj, tokens)
+            except (KeyError, IndexError, TypeError):
+                return _MISSING
+        return from_ref
+    raise ValueError(f"Biểu thức không hợp lệ: {expr}")
+
+
+def plan_bulk_edit(files: Dict[str, bytes], match: Callable[[str], bool], transform) -> List[tuple]:
+    """Tìm các hàng bị ảnh hưởng trên mọi tệp JSON: [(member, path, tokens, cũ, mới)]."""
+    rows = []
+    for member in sorted(files):
+        if not is_json_like(member):
+            continue
+        try:
+            obj = json.loads(files[member].decode("utf-8"))
+        except Exception:
+            continue
+        for path, tokens, value in iter_json_leaves(obj):
+            if not tokens or not match(path):
+                continue
+            new = transform(member, tokens, value)
+            if new is _MISSING or (new == value and type(new) is type(value)):
+                continue
+            rows.append((member, path, tokens, value, new))
+    return rows
+
+
+def apply_bulk_edit(files: Dict[str, bytes], rows: List[tuple]) -> Tuple[Dict[str, bytes], List[str]]:
+    """Ghi các hàng đã xem trước; mỗi tệp chỉ parse/serialize một lần.
+
+    Hàng có giá trị hiện tại khác giá trị lúc xem trước (tệp đã đổi trong lúc
+    chờ) bị bỏ qua. Trả về (tệp đã cập nhật, danh sách hàng bị bỏ qua).
+    """
+    by_member: Dict[str, List[tuple]] = {}
+    for row in rows:
+        by_member.setdefault(row[0], []).append(row)
+    updated = {}
+    skipped = []
+    for member, member_rows in by_member.items():
+        try:
+            obj = json.loads(files[member].decode("utf-8"))
+        except Exception:
+            skipped += [f"{member}: {path}" for _, path, _, _, _ in member_rows]
+            continue
+        changed = False
+        for _, path, tokens, old, new in member_rows:
+            try:
+                cur = get_json_tokens(obj, tokens)
+            except (KeyError, IndexError, TypeError):
+                cur = _MISSING
+            if cur is _MISSING or cur != old or type(cur) is not type(old):
+                skipped.append(f"{member}: {path}")
+                continue
+            set_json_tokens(obj, tokens, new)
+            changed = True
+        if changed:
+            updated[member] = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return updated, skipped
+
+
+# ------------------------- Incremental build -------------------------
+class _CachedMember:
+    __slots__ = ("stat_key", "digest", "data", "method", "crc", "blob", "dos_time", "dos_date")
+
+    def __init__(self) -> None:
+        self.stat_key: Optional[Tuple[int, int]] = None  # (mtime_ns, size) khi đọc từ thư mục
+        self.digest = b""
+        self.data = b""
+        self.method = zipfile.ZIP_DEFLATED
+        self.crc = 0
+        self.blob = b""  # dữ liệu đã nén sẵn (raw deflate) để ghép thẳng vào ZIP
+        self.dos_time = 0
+        self.dos_date = 0
+
+
+def _dos_datetime(ts: float) -> Tuple[int, int]:
+    t = time.localtime(ts)
+    year = max(t.tm_year, 1980)
+    return (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2), ((year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+
+
+class IncrementalVsixBuilder:
+    """Giữ cache các member đã nén; lần build sau chỉ nén lại tệp thay đổi.
+
+    Thay đổi được phát hiện bằng mtime/size (khi quét thư mục) rồi xác nhận
+    bằng hash nội dung, nên tệp chỉ bị "touch" sẽ không bị nén lại.
+    """
+
+    def __init__(self, level: int = zlib.Z_DEFAULT_COMPRESSION) -> None:
+        self.level = level
+        self.members: Dict[str, _CachedMember] = {}
+        self.compressed_count = 0  # số lần nén (phục vụ thống kê)
+
+    def _compress(self, m: _CachedMember, data: bytes) -> None:
+        co = zlib.compressobj(self.level, zlib.DEFLATED, -15)
+        blob = co.compress(data) + co.flush()
+        m.crc = zlib.crc32(data)
+        # ảnh/tệp đã nén sẵn: lưu thẳng nếu deflate không nhỏ hơn
+        if len(blob) < len(data):
+            m.method, m.blob = zipfile.ZIP_DEFLATED, blob
+        else:
+            m.method, m.blob = zipfile.ZIP_STORED, data
+        self.compressed_count += 1
+
+    def _update(self, name: str, data: bytes, mtime: float) -> Tuple[_CachedMember, bool]:
+        """Trả về (member, có thay đổi nội dung). Chưa nén — xem _compress_pending."""
+        digest = hashlib.sha1(data).digest()
+        m = self.members.get(name)
+        if m is not None and m.digest == digest:
+            return m, False
+        if m is None:
+            m = self.members[name] = _CachedMember()
+        m.digest = digest
+        m.data = data
+        m.blob = b""
+        m.dos_time, m.dos_date = _dos_datetime(mtime)
+        return m, True
+
+    def _compress_pending(self, pending: List[_CachedMember]) -> None:
+        # zlib nhả GIL khi nén nên có thể nén song song bằng luồng
+        if len(pending) > 1:
+            with ThreadPoolExecutor() as ex:
+                list(ex.map(lambda m: self._compress(m, m.data), pending))
+        else:
+            for m in pending:
+                self._compress(m, m.data)
+
+    def sync_members(self, files: Dict[str, bytes]) -> List[str]:
+        """Đồng bộ cache với dữ liệu trong bộ nhớ; trả về danh sách tệp đã đổi."""
+        now = time.time()
+        changed, pending = [], []
+        for name, data in files.items():
+            m, is_changed = self._update(name, data, now)
+            if is_changed:
+                changed.append(name)
+                pending.append(m)
+        for name in [n for n in self.members if n not in files]:
+            del self.members[name]
+        self._compress_pending(pending)
+        return changed
+
+    def scan_dir(self, src_dir: str, exclude: Iterable[str] = ()) -> Tuple[List[str], List[str]]:
+        """Quét thư mục làm việc; trả về (tệp đổi/mới, tệp đã xoá).
+
+        `exclude`: đường dẫn bỏ qua (VSIX đầu ra và tệp .tmp nếu nằm trong thư mục).
+        """
+        skip = {os.path.normcase(os.path.abspath(p)) for p in exclude}
+        seen = set()
+        changed, pending = [], []
+        for dirpath, dirnames, filenames in os.walk(src_dir):
+            dirnames.sort()
+            for fn in sorted(filenames):
+                full = os.path.join(dirpath, fn)
+                if skip and os.path.normcase(os.path.abspath(full)) in skip:
+                    continue
+                name = os.path.relpath(full, src_dir).replace(os.sep, "/")
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                seen.add(name)
+                stat_key = (st.st_mtime_ns, st.st_size)
+                m = self.members.get(name)
+                if m is not None and m.stat_key == stat_key:
+                    continue
+                try:
+                    with open(full, "rb") as f:
+                        data = f.read()
+                except OSError:
+                    # tạm thời không đọc được (vd. đang bị khoá khi lưu): giữ bản cache,
+                    # stat_key không đổi nên lần quét sau sẽ đọc lại
+                    continue
+                m, is_changed = self._update(name, data, st.st_mtime)
+                m.stat_key = stat_key
+                if is_changed:
+                    changed.append(name)
+                    pending.append(m)
+        removed = [n for n in self.members if n not in seen]
+        for name in removed:
+            del self.members[name]
+        self._compress_pending(pending)
+        return changed, removed
+
+    def files(self) -> Dict[str, bytes]:
+        return {name: m.data for name, m in self.members.items()}
+
+    def write(self, out_path: str) -> None:
+        """Ghép VSIX từ các blob đã nén sẵn (ghi ra tệp tạm rồi thay thế)."""
+        if len(self.members) >= 0xFFFF:
+            raise ValueError("Quá nhiều tệp cho định dạng ZIP thường (cần ZIP64)")
+        tmp_path = out_path + ".tmp"
+        central = []
+        offset = 0
+        with open(tmp_path, "wb") as f:
+            for name, m in self.members.items():
+                if not m.blob and m.data:
+                    self._compress(m, m.data)
+                try:
+                    fname = name.encode("ascii")
+                    flags = 0
+                except UnicodeEncodeError:
+                    fname = name.encode("utf-8")
+                    flags = 0x800
+                size = len(m.data)
+                csize = len(m.blob)
+                if offset > 0xFFFFFFFF or size > 0xFFFFFFFF or csize > 0xFFFFFFFF:
+                    raise ValueError("Tệp quá lớn cho định dạng ZIP thường (cần ZIP64)")
+                header = struct.pack(
+                    "<IHHHHHIIIHH", 0x04034B50, 20, flags, m.method, m.dos_time, m.dos_date,
+                    m.crc, csize, size, len(fname), 0,
+                )
+                f.write(header)
+                f.write(fname)
+                f.write(m.blob)
+                central.append(struct.pack(
+                    "<IHHHHHHIIIHHHHHII", 0x02014B50, 20, 20, flags, m.method, m.dos_time, m.dos_date,
+                    m.crc, csize, size, len(fname), 0, 0, 0, 0, 0o644 << 16, offset,
+                ) + fname)
+                offset += len(header) + len(fname) + csize
+            cd = b"".join(central)
+            if offset > 0xFFFFFFFF:
+                raise ValueError("Tệp quá lớn cho định dạng ZIP thường (cần ZIP64)")
+            f.write(cd)
+            f.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central), len(cd), offset, 0))
+        os.replace(tmp_path, out_path)
+
+
+def watch_vsix_dir(src_dir: str, out_path: str, interval: float = 1.0, once: bool = False) -> None:
+    """Theo dõi thư mục đã giải nén và build lại VSIX mỗi khi có thay đổi."""
+    builder = IncrementalVsixBuilder()
+    while True:
+        t0 = time.perf_counter()
+        changed, removed = builder.scan_dir(src_dir, exclude=(out_path, out_path + ".tmp"))
+        if changed or removed:
+            builder.write(out_path)
+            print(f"[watch] {os.path.basename(out_path)}: {len(changed)} đổi, {len(removed)} xoá, "
+                  f"{len(builder.members)} tệp — {(time.perf_counter() - t0) * 1000:.0f} ms", flush=True)
+        if once:
+            return
+        time.sleep(interval)
+
+
 class VsixEditorApp:
-    def __init__(self, root: Tk) -> None:
+    def __init__(self, root: Tk, initial_path: Optional[str] = None, lazy: bool = False,
+                 watch_out: Optional[str] = None, show_dialogs: bool = True) -> None:
         self.root = root
         self.root.title("VSIX Editor — MVP")
         self.vsix_path: Optional[str] = None
@@ -62,45 +652,75 @@ class VsixEditorApp:
         # In-memory representation: file_path -> bytes
         self.files_data: Dict[str, bytes] = {}
 
+        # Thư mục đã giải nén làm bản làm việc (watch) + VSIX tự build lại
+        self.watch_dir: Optional[str] = None
+        self.watch_out = watch_out
+        self._watch_builder = IncrementalVsixBuilder()
+        self._unsaved: set = set()  # tệp sửa trong bộ nhớ nhưng chưa ghi ra thư mục làm việc
+        self._export_builder = IncrementalVsixBuilder()  # cache blob giữa các lần xuất
+        self._read_errors: List[str] = []
+        self._reference_files: Optional[Dict[str, bytes]] = None  # bản gốc cho bulk edit 'ref'
+        # False khi đo khởi động: thông báo lúc nạp VSIX in ra stdout thay vì hộp thoại chặn
+        self.show_dialogs = show_dialogs
+
+        # Đọc VSIX truyền qua dòng lệnh song song với việc dựng UI
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vsix-load")
+        self._pending_load = None
+        if initial_path:
+            self._pending_load = (initial_path, self._executor.submit(
+                self._read_source, initial_path, self._watch_exclude()))
+
         # Current selection state
         self.current_file: Optional[str] = None
         self.allow_md_edit = BooleanVar(value=False)
 
         # UI
+        # lazy: không import customtkinter (cả phiên dùng ttk để giao diện đồng nhất),
+        # theme ttk áp sau lần vẽ đầu, nội dung từng tab chỉ dựng khi tab hiện lần đầu.
+        self.lazy = lazy
+        self._tabs_built: set = set()
+        self._inline_editor = None
         self.dark_mode = BooleanVar(value=True)
-        # Nếu có customtkinter: set theme trước để áp dụng màu đồng nhất
-        if ctk is not None:
-            try:
-                ctk.set_default_color_theme("blue")
-                ctk.set_appearance_mode("dark")
-            except Exception:
-                pass
-        self._init_theme()  # thiết lập theme trước khi build UI
+        if not lazy:
+            _load_ctk()
+            self._init_theme()  # thiết lập theme trước khi build UI
         self._build_ui()
         self._all_files = []  # full list of names for left pane
+        if lazy:
+            self.root.after_idle(self._init_theme)
+        if self._pending_load is not None:
+            self.status.set(f"Đang mở: {os.path.basename(self._pending_load[0])}...")
+            self.root.after(10, self._poll_pending_load)
 
     # ------------------------- UI -------------------------
+    def _mk_button(self, parent, **kw):
+        if ctk is not None:
+            return ctk.CTkButton(parent, **kw)
+        return ttk.Button(parent, **kw)
+
+    def _mk_check(self, parent, **kw):
+        if ctk is not None:
+            return ctk.CTkCheckBox(parent, **kw)
+        return ttk.Checkbutton(parent, **kw)
+
     def _build_ui(self) -> None:
         # Thanh công cụ trên cùng (CTkFrame nếu có)
         topbar = (ctk.CTkFrame(self.root) if ctk is not None else ttk.Frame(self.root))
         topbar.pack(fill=X, padx=8, pady=6)
 
-        def mk_button(parent, **kw):
-            if ctk is not None:
-                return ctk.CTkButton(parent, **kw)
-            return ttk.Button(parent, **kw)
-
-        def mk_check(parent, **kw):
-            if ctk is not None:
-                return ctk.CTkCheckBox(parent, **kw)
-            return ttk.Checkbutton(parent, **kw)
+        mk_button = self._mk_button
+        mk_check = self._mk_check
 
         mk_button(topbar, text="Mở VSIX", command=self.open_vsix).pack(side=LEFT, padx=4)
+        mk_button(topbar, text="Mở thư mục", command=self.open_dir).pack(side=LEFT, padx=4)
         mk_button(topbar, text="Lưu file hiện tại", command=self.save_current_file).pack(side=LEFT, padx=4)
         mk_button(topbar, text="Xuất VSIX mới", command=self.export_vsix_dialog).pack(side=LEFT, padx=4)
 
         self.auto_bump = BooleanVar(value=True)
         mk_check(topbar, text="Auto bump patch (package.json)", variable=self.auto_bump).pack(side=LEFT, padx=8)
+        self.verify_on_export = BooleanVar(value=True)
+        mk_check(topbar, text="Kiểm tra khi xuất", variable=self.verify_on_export).pack(side=LEFT, padx=8)
+        mk_button(topbar, text="Kiểm tra VSIX", command=self.verify_current).pack(side=LEFT, padx=4)
         mk_check(topbar, text="Dark mode", variable=self.dark_mode, command=self._toggle_theme).pack(side=LEFT, padx=8)
 
         # Main split: left/right
@@ -215,6 +835,35 @@ class VsixEditorApp:
             md_tab = ttk.Frame(notebook)
             notebook.add(json_tab, text="JSON")
             notebook.add(md_tab, text="Văn bản")
+        self._tab_frames = {"json": json_tab, "md": md_tab}
+
+        # Close inline editor on global window resize / notebook layout changes & paned sash drag
+        self.root.bind("<Configure>", lambda e: self._close_inline_editor())
+        paned.bind("<B1-Motion>", lambda e: self._close_inline_editor())
+
+        # Status bar
+        self.status = StringVar(value="Sẵn sàng.")
+        ttk.Label(self.root, textvariable=self.status, anchor="w").pack(fill=X, padx=8, pady=(0, 6))
+
+        if self.lazy:
+            json_tab.bind("<Map>", lambda e: self._ensure_tab("json"))
+            md_tab.bind("<Map>", lambda e: self._ensure_tab("md"))
+        else:
+            self._ensure_tab("json")
+            self._ensure_tab("md")
+
+    def _ensure_tab(self, name: str) -> None:
+        """Dựng nội dung tab (một lần); ở chế độ lazy được gọi khi tab hiện lần đầu."""
+        if name in self._tabs_built:
+            return
+        self._tabs_built.add(name)
+        if name == "json":
+            self._build_json_tab(self._tab_frames["json"])
+        else:
+            self._build_md_tab(self._tab_frames["md"])
+
+    def _build_json_tab(self, json_tab) -> None:
+        mk_button = self._mk_button
 
         # JSON tab contents
         json_filter_bar = (ctk.CTkFrame(json_tab) if ctk is not None else ttk.Frame(json_tab))
@@ -245,11 +894,7 @@ class VsixEditorApp:
 
         self.json_tree.bind("<Double-1>", self._on_json_cell_double_click)
         # Close inline editor on resize to avoid overlay issues
-        self._inline_editor = None
         self.json_tree.bind("<Configure>", lambda e: self._close_inline_editor())
-        # Also close on global window resize / notebook layout changes & paned sash drag
-        self.root.bind("<Configure>", lambda e: self._close_inline_editor())
-        paned.bind("<B1-Motion>", lambda e: self._close_inline_editor())
 
         # Find & Replace across all JSON
         fr_bar = (ctk.CTkFrame(json_tab) if ctk is not None else ttk.Frame(json_tab))
@@ -264,6 +909,21 @@ class VsixEditorApp:
         (ctk.CTkCheckBox(fr_bar, text="Phân biệt hoa/thường", variable=self.find_case_sensitive) if ctk is not None else ttk.Checkbutton(fr_bar, text="Phân biệt hoa/thường", variable=self.find_case_sensitive)).pack(side=LEFT)
         mk_button(fr_bar, text="Tìm & Thay (mọi JSON)", command=self._find_replace_all_json).pack(side=LEFT, padx=(12, 0))
 
+        # Bulk edit theo path across all JSON
+        be_bar = (ctk.CTkFrame(json_tab) if ctk is not None else ttk.Frame(json_tab))
+        be_bar.pack(fill=X, pady=(6, 0))
+        (ctk.CTkLabel(be_bar, text="Path:") if ctk is not None else ttk.Label(be_bar, text="Path:")).pack(side=LEFT)
+        self.bulk_path = StringVar(value="")
+        (ctk.CTkEntry(be_bar, textvariable=self.bulk_path, width=240) if ctk is not None else ttk.Entry(be_bar, textvariable=self.bulk_path, width=28)).pack(side=LEFT, padx=(4, 8))
+        self.bulk_regex = BooleanVar(value=False)
+        (ctk.CTkCheckBox(be_bar, text="Regex", variable=self.bulk_regex) if ctk is not None else ttk.Checkbutton(be_bar, text="Regex", variable=self.bulk_regex)).pack(side=LEFT)
+        (ctk.CTkLabel(be_bar, text="Giá trị/biến đổi:") if ctk is not None else ttk.Label(be_bar, text="Giá trị/biến đổi:")).pack(side=LEFT, padx=(12, 0))
+        self.bulk_expr = StringVar(value="")
+        (ctk.CTkEntry(be_bar, textvariable=self.bulk_expr, width=200) if ctk is not None else ttk.Entry(be_bar, textvariable=self.bulk_expr, width=24)).pack(side=LEFT, padx=(4, 8))
+        mk_button(be_bar, text="Bản gốc...", command=self._choose_reference).pack(side=LEFT)
+        mk_button(be_bar, text="Xem trước sửa theo path", command=self._bulk_edit_preview).pack(side=LEFT, padx=(6, 0))
+
+    def _build_md_tab(self, md_tab) -> None:
         # MD tab contents
         md_frame = (ctk.CTkFrame(md_tab) if ctk is not None else ttk.Frame(md_tab))
         md_frame.pack(fill=BOTH, expand=True)
@@ -273,10 +933,7 @@ class VsixEditorApp:
         md_scroll = Scrollbar(md_frame, orient="vertical", command=self.md_text.yview)
         self.md_text.configure(yscrollcommand=md_scroll.set)
         md_scroll.pack(side=RIGHT, fill=Y)
-
-        # Status bar
-        self.status = StringVar(value="Sẵn sàng.")
-        ttk.Label(self.root, textvariable=self.status, anchor="w").pack(fill=X, padx=8, pady=(0, 6))
+        self._apply_text_colors()
 
     # ------------------------- Theme -------------------------
     def _init_theme(self) -> None:
@@ -334,11 +991,18 @@ class VsixEditorApp:
         style.configure('Vertical.TScrollbar', background=panel, troughcolor=bg, bordercolor=hl)
 
         # Text widget (không thuộc ttk) — đặt trực tiếp khi dùng
-        if hasattr(self, 'md_text'):
-            try:
-                self.md_text.configure(bg=panel, fg=fg, insertbackground=fg)
-            except Exception:
-                pass
+        self._text_colors = (panel, fg)
+        self._apply_text_colors()
+
+    def _apply_text_colors(self) -> None:
+        colors = getattr(self, '_text_colors', None)
+        if colors is None or not hasattr(self, 'md_text'):
+            return
+        panel, fg = colors
+        try:
+            self.md_text.configure(bg=panel, fg=fg, insertbackground=fg)
+        except Exception:
+            pass
 
     def _toggle_theme(self) -> None:
         # Gọi lại init theme với trạng thái mới
@@ -351,30 +1015,180 @@ class VsixEditorApp:
             return
         self._open_vsix(path)
 
+    def open_dir(self) -> None:
+        path = filedialog.askdirectory(title="Chọn thư mục VSIX đã giải nén")
+        if not path:
+            return
+        self._open_vsix(path)
+
+    def _notify(self, kind: str, title: str, text: str) -> None:
+        if not self.show_dialogs:
+            print(f"{title}: {text}")
+            return
+        getattr(messagebox, kind)(title, text)
+
+    @staticmethod
+    def _read_source(path: str, exclude: Tuple[str, ...] = ()):
+        """Đọc VSIX/thư mục; trả về (files, errors, builder hoặc None).
+
+        Có thể chạy ở luồng nền nên không đụng tới thuộc tính của app; kết quả
+        được áp dụng trên luồng Tk qua _apply_source.
+        """
+        # Thư mục: quét qua builder để lần watch/build sau dùng lại cache
+        if os.path.isdir(path):
+            builder = IncrementalVsixBuilder()
+            builder.scan_dir(path, exclude=exclude)
+            files = builder.files()
+            return files, check_member_names(files), builder
+        errors: List[str] = []
+        files = read_vsix_members(path, errors)
+        return files, errors, None
+
     def _open_vsix(self, path: str) -> None:
+        # Người dùng tự mở tệp khác: bỏ kết quả nạp từ dòng lệnh nếu chưa xong
+        self._pending_load = None
         try:
-            with zipfile.ZipFile(path, "r") as zf:
-                names = zf.namelist()
-                self.files_data.clear()
-                for n in names:
-                    try:
-                        self.files_data[n] = zf.read(n)
-                    except Exception:
-                        self.files_data[n] = b""
+            result = self._read_source(path, self._watch_exclude())
         except Exception as e:
-            messagebox.showerror("Lỗi", f"Không thể mở VSIX: {e}")
+            self._notify("showerror", "Lỗi", f"Không thể mở VSIX: {e}")
             return
+        self._apply_source(path, result)
+
+    def _apply_source(self, path: str, result) -> None:
+        files, errors, builder = result
+        if builder is not None:
+            self._watch_builder = builder
+        self._read_errors = errors
+        self._set_vsix(path, files)
+
+    def _set_vsix(self, path: str, files: Dict[str, bytes]) -> None:
+        self.files_data.clear()
+        self.files_data.update(files)
+        self._unsaved.clear()
         # populate list with filters support
         self._all_files = sorted(self.files_data.keys())
         self._refresh_file_list()
-        self.status.set(f"Đã mở: {os.path.basename(path)} — {len(names)} tệp")
+        self.status.set(f"Đã mở: {os.path.basename(path)} — {len(files)} tệp")
         self.vsix_path = path
+        problems = self._read_errors + check_vsix_consistency(files, files.__getitem__)
+        if problems:
+            self.status.set(f"Đã mở: {os.path.basename(path)} — {len(files)} tệp, {len(problems)} vấn đề")
+            self._notify("showwarning", "Cảnh báo", f"VSIX có vấn đề:\n{format_problems(problems)}")
+        was_watching = self.watch_dir is not None
+        self.watch_dir = path if os.path.isdir(path) else None
+        if self.watch_dir is not None:
+            if self.watch_out:
+                self._rebuild_watch_out()
+            if not was_watching:
+                self.root.after(1000, self._poll_watch_dir)
+
+    # ------------------------- Watch (thư mục làm việc) -------------------------
+    def _poll_watch_dir(self) -> None:
+        if self.watch_dir is None:
+            return
+        try:
+            changed, removed = self._watch_builder.scan_dir(self.watch_dir, exclude=self._watch_exclude())
+        except Exception as e:
+            self.status.set(f"Lỗi theo dõi thư mục: {e}")
+            changed, removed = [], []
+        if changed or removed:
+            added = [n for n in changed if n not in self.files_data]
+            keep = set()
+            conflicts = [n for n in changed if self._has_unsaved(n)]
+            if conflicts and not messagebox.askyesno(
+                    "Cảnh báo", "Các tệp sau đã đổi trên đĩa nhưng còn thay đổi chưa lưu:\n"
+                    f"{format_problems(conflicts)}\n\nNạp lại từ đĩa (bỏ thay đổi chưa lưu)?"):
+                keep = set(conflicts)
+            for name in changed:
+                if name in keep:
+                    continue
+                self.files_data[name] = self._watch_builder.members[name].data
+                self._unsaved.discard(name)
+            for name in removed:
+                self.files_data.pop(name, None)
+            if added or removed:
+                self._all_files = sorted(self.files_data.keys())
+                self._refresh_file_list()
+            if self.current_file in changed and self.current_file not in keep:
+                self._show_file(self.current_file)
+            self.status.set(f"Thư mục thay đổi: {len(changed)} đổi, {len(removed)} xoá")
+            if self.watch_out:
+                self._rebuild_watch_out()
+        self.root.after(1000, self._poll_watch_dir)
+
+    def _watch_exclude(self) -> Tuple[str, ...]:
+        # VSIX đầu ra có thể nằm trong thư mục đang theo dõi: không tự đóng gói lại chính nó
+        if not self.watch_out:
+            return ()
+        return (self.watch_out, self.watch_out + ".tmp")
+
+    def _has_unsaved(self, name: str) -> bool:
+        if name in self._unsaved:
+            return True
+        # văn bản đang sửa trong tab Văn bản (cờ modified của Text)
+        return (name == self.current_file and is_md_like(name) and hasattr(self, "md_text")
+                and bool(self.md_text.edit_modified()))
+
+    def _rebuild_watch_out(self) -> None:
+        t0 = time.perf_counter()
+        try:
+            self._watch_builder.write(self.watch_out)
+        except Exception as e:
+            self.status.set(f"Không thể build lại VSIX: {e}")
+            return
+        self.status.set(f"Đã build lại {os.path.basename(self.watch_out)} "
+                        f"({len(self._watch_builder.members)} tệp, {(time.perf_counter() - t0) * 1000:.0f} ms)")
+
+    def _store_updated_members(self, updated: Dict[str, bytes]) -> None:
+        """Cập nhật nhiều tệp sau thao tác hàng loạt; ở chế độ thư mục ghi luôn ra đĩa."""
+        self.files_data.update(updated)
+        if self.watch_dir is None:
+            self._unsaved.update(updated)
+            return
+        # ghi ra thư mục làm việc để VSIX tự build (--out) nhận được thay đổi
+        failed = []
+        for name, data in updated.items():
+            try:
+                self._write_working_copy(name, data)
+                self._unsaved.discard(name)
+            except Exception as e:
+                self._unsaved.add(name)
+                failed.append(f"{name}: {e}")
+        if failed:
+            messagebox.showerror("Lỗi", f"Không thể ghi tệp vào thư mục:\n{format_problems(failed)}")
+
+    def _write_working_copy(self, name: str, data: bytes) -> None:
+        # Ở chế độ thư mục: ghi thẳng ra đĩa, lần quét sau sẽ build lại VSIX
+        full = os.path.join(self.watch_dir, *name.split("/"))
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "wb") as f:
+            f.write(data)
+
+    def _poll_pending_load(self) -> None:
+        # Future hoàn tất ở luồng nền; cập nhật UI luôn trên luồng Tk
+        if self._pending_load is None:  # đã bị huỷ do người dùng mở tệp khác
+            return
+        path, fut = self._pending_load
+        if not fut.done():
+            self.root.after(10, self._poll_pending_load)
+            return
+        self._pending_load = None
+        try:
+            result = fut.result()
+        except Exception as e:
+            self.status.set("Sẵn sàng.")
+            self._notify("showerror", "Lỗi", f"Không thể mở VSIX: {e}")
+            return
+        self._apply_source(path, result)
 
     def on_select_file(self, event=None) -> None:
         sel = self.listbox.selection()
         if not sel:
             return
         name = self.listbox.item(sel[0], "values")[0]
+        self._show_file(name)
+
+    def _show_file(self, name: str) -> None:
         self.current_file = name
         data = self.files_data.get(name, b"")
         # Route to appropriate viewer
@@ -441,6 +1255,9 @@ class VsixEditorApp:
 
     # ------------------------- JSON View -------------------------
     def _show_json(self, raw: Optional[bytes]) -> None:
+        if raw is None and "json" not in self._tabs_built:
+            return
+        self._ensure_tab("json")
         for iid in self.json_tree.get_children():
             self.json_tree.delete(iid)
         if raw is None:
@@ -452,20 +1269,7 @@ class VsixEditorApp:
             return
 
         # Flatten JSON to key-paths
-        flat = {}
-
-        def walk(prefix, val):
-            if isinstance(val, dict):
-                for k, v in val.items():
-                    walk(f"{prefix}.{k}" if prefix else str(k), v)
-            elif isinstance(val, list):
-                for i, v in enumerate(val):
-                    walk(f"{prefix}[{i}]", v)
-            else:
-                flat[prefix] = val
-
-        walk("", obj)
-        self._json_flat = {k: flat[k] for k in flat}
+        self._json_flat = {path: val for path, _, val in iter_json_leaves(obj)}
         self._render_json_rows(self._json_flat)
 
         # Store parsed object for editing
@@ -597,9 +1401,14 @@ class VsixEditorApp:
                     ref[tk] = value
             else:
                 ref = ref[tk]
+        if self.current_file:
+            self._unsaved.add(self.current_file)
 
     # ------------------------- MD View -------------------------
     def _show_md(self, raw: Optional[bytes]) -> None:
+        if raw is None and "md" not in self._tabs_built:
+            return
+        self._ensure_tab("md")
         self.md_text.config(state="normal")
         self.md_text.delete("1.0", END)
         if raw is not None:
@@ -607,9 +1416,12 @@ class VsixEditorApp:
                 self.md_text.insert("1.0", raw.decode("utf-8"))
             except Exception:
                 self.md_text.insert("1.0", "<binary or non-utf8 content>")
+        self.md_text.edit_modified(False)
         self._toggle_md_state()
 
     def _toggle_md_state(self) -> None:
+        if not hasattr(self, "md_text"):
+            return
         if self.allow_md_edit.get():
             self.md_text.config(state="normal")
         else:
@@ -628,16 +1440,48 @@ class VsixEditorApp:
                 messagebox.showerror("Lỗi", f"Không serialize JSON: {e}")
                 return
             self.files_data[name] = new_bytes
-            self.status.set(f"Đã lưu vào bộ nhớ: {name}")
         elif is_md_like(name):
             if not self.allow_md_edit.get():
                 messagebox.showinfo("Thông báo", "Bật 'Sửa văn bản (.md)' để lưu thay đổi.")
                 return
             text = self.md_text.get("1.0", END).encode("utf-8")
             self.files_data[name] = text
-            self.status.set(f"Đã lưu vào bộ nhớ: {name}")
         else:
             messagebox.showinfo("Thông báo", "Loại tệp này đang chỉ xem trước (chưa hỗ trợ chỉnh sửa).")
+            return
+        if self.watch_dir is not None:
+            try:
+                self._write_working_copy(name, self.files_data[name])
+            except Exception as e:
+                messagebox.showerror("Lỗi", f"Không thể ghi tệp vào thư mục: {e}")
+                return
+            self.status.set(f"Đã lưu vào thư mục: {name}")
+        else:
+            self.status.set(f"Đã lưu vào bộ nhớ: {name}")
+        self._unsaved.discard(name)
+        if is_md_like(name):
+            self.md_text.edit_modified(False)
+
+    def verify_current(self) -> None:
+        if not self.files_data:
+            messagebox.showinfo("Thông báo", "Chưa mở VSIX nào.")
+            return
+        t0 = time.perf_counter()
+        problems = check_member_names(self.files_data)
+        problems += check_vsix_consistency(self.files_data, self.files_data.__getitem__)
+        # CRC của tệp VSIX gốc trên đĩa (nội dung trong bộ nhớ không có CRC để so)
+        if self.vsix_path and os.path.isfile(self.vsix_path):
+            try:
+                problems += check_vsix_crcs(self.vsix_path)
+            except Exception as e:
+                problems.append(f"{os.path.basename(self.vsix_path)}: {e}")
+        elapsed = (time.perf_counter() - t0) * 1000
+        if problems:
+            self.status.set(f"Kiểm tra: {len(problems)} vấn đề ({elapsed:.0f} ms)")
+            messagebox.showwarning("Cảnh báo", f"VSIX có vấn đề:\n{format_problems(problems)}")
+        else:
+            self.status.set(f"Kiểm tra: không có vấn đề ({elapsed:.0f} ms)")
+            messagebox.showinfo("Thông báo", "Không phát hiện vấn đề.")
 
     def export_vsix_dialog(self) -> None:
         if not self.files_data:
@@ -652,28 +1496,119 @@ class VsixEditorApp:
         data = dict(self.files_data)
         if auto_bump:
             try:
-                if "package.json" in data:
-                    pkg = json.loads(data["package.json"].decode("utf-8"))
-                    ver = str(pkg.get("version", "0.0.0"))
-                    m = re.match(r"^(\d+)\.(\d+)\.(\d+)$", ver)
-                    if m:
-                        x, y, z = map(int, m.groups())
-                        pkg["version"] = f"{x}.{y}.{z+1}"
-                        data["package.json"] = json.dumps(pkg, ensure_ascii=False, indent=2).encode("utf-8")
+                bump_patch_version(data)
             except Exception as e:
                 messagebox.showwarning("Cảnh báo", f"Không thể auto bump version: {e}")
 
+        verify = self.verify_on_export.get()
+        # Tệp đọc lỗi khi mở không có trong bộ nhớ: luôn báo, kể cả khi tắt kiểm tra
+        problems = list(self._read_errors)
+        if verify:
+            problems += check_member_names(data) + check_vsix_consistency(data, data.__getitem__)
+        if problems and not messagebox.askyesno(
+                "Cảnh báo", f"VSIX có vấn đề:\n{format_problems(problems)}\n\nVẫn xuất VSIX?"):
+            self.status.set("Đã huỷ xuất VSIX")
+            return
+
         try:
-            with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-                for name, content in data.items():
-                    # Ensure directories in zip path are handled by ZipInfo automatically
-                    zf.writestr(name, content)
+            # Chỉ nén lại các tệp đổi so với lần xuất trước, phần còn lại dùng blob đã cache
+            self._export_builder.sync_members(data)
+            self._export_builder.write(out_path)
         except Exception as e:
             messagebox.showerror("Lỗi", f"Không thể xuất VSIX: {e}")
             return
+        if verify:
+            problems = check_vsix_crcs(out_path)
+            if problems:
+                messagebox.showerror("Lỗi", f"VSIX vừa xuất bị lỗi dữ liệu:\n{format_problems(problems)}")
+                self.status.set(f"VSIX vừa xuất bị lỗi: {out_path}")
+                return
         messagebox.showinfo("Thành công", f"Đã xuất VSIX: {out_path}")
         self.status.set(f"Đã xuất VSIX: {out_path}")
 
+    # ------------------------- Bulk edit theo path -------------------------
+    def _choose_reference(self) -> None:
+        path = filedialog.askopenfilename(title="Chọn VSIX gốc (cho biểu thức 'ref')",
+                                          filetypes=[("VSIX (ZIP)", "*.vsix"), ("ZIP", "*.zip"), ("All", "*.*")])
+        if not path:
+            return
+        try:
+            self._reference_files = read_vsix_members(path)
+        except Exception as e:
+            messagebox.showerror("Lỗi", f"Không thể mở VSIX gốc: {e}")
+            return
+        self.status.set(f"Bản gốc: {os.path.basename(path)} — {len(self._reference_files)} tệp")
+
+    def _bulk_edit_preview(self) -> None:
+        pattern = self.bulk_path.get().strip()
+        expr = self.bulk_expr.get()
+        if not pattern or not expr:
+            messagebox.showinfo("Thông báo", "Vui lòng nhập mẫu path và giá trị/biến đổi.")
+            return
+        try:
+            match = compile_path_pattern(pattern, use_regex=self.bulk_regex.get())
+            transform = compile_value_transform(expr, self._reference_files)
+        except (re.error, ValueError) as e:
+            messagebox.showerror("Lỗi", f"Biểu thức không hợp lệ: {e}")
+            return
+        t0 = time.perf_counter()
+        rows = plan_bulk_edit(self.files_data, match, transform)
+        elapsed = (time.perf_counter() - t0) * 1000
+        if not rows:
+            self.status.set(f"Sửa theo path: không có hàng nào thay đổi ({elapsed:.0f} ms)")
+            return
+        self._show_bulk_preview(rows)
+
+    def _show_bulk_preview(self, rows: List[tuple], limit: int = 5000) -> None:
+        members = {r[0] for r in rows}
+        win = Toplevel(self.root)
+        win.title(f"Xem trước: {len(rows)} hàng trong {len(members)} tệp")
+        win.geometry("1000x520")
+        win.transient(self.root)
+        win.grab_set()  # modal: không để tệp bị sửa chỗ khác trong lúc xem trước
+        frame = ttk.Frame(win)
+        frame.pack(fill=BOTH, expand=True, padx=8, pady=6)
+        tree = ttk.Treeview(frame, columns=("file", "path", "old", "new"), show="headings")
+        for col, text, width in (("file", "tệp", 220), ("path", "path", 260), ("old", "cũ", 240), ("new", "mới", 240)):
+            tree.heading(col, text=text)
+            tree.column(col, width=width)
+        tree.pack(side=LEFT, fill=BOTH, expand=True)
+        yscroll = Scrollbar(frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=yscroll.set)
+        yscroll.pack(side=RIGHT, fill=Y)
+        # Giới hạn số hàng hiển thị để cửa sổ xem trước không bị đơ với gói lớn
+        for member, path, _, old, new in rows[:limit]:
+            tree.insert("", END, values=(member, path, json.dumps(old, ensure_ascii=False),
+                                         json.dumps(new, ensure_ascii=False)))
+        bar = ttk.Frame(win)
+        bar.pack(fill=X, padx=8, pady=(0, 6))
+        note = f"{len(rows)} hàng / {len(members)} tệp"
+        if len(rows) > limit:
+            note += f" (hiển thị {limit} hàng đầu)"
+        ttk.Label(bar, text=note).pack(side=LEFT)
+
+        def apply():
+            win.destroy()
+            self._bulk_edit_apply(rows)
+
+        ttk.Button(bar, text="Huỷ", command=win.destroy).pack(side=RIGHT)
+        ttk.Button(bar, text="Áp dụng", command=apply).pack(side=RIGHT, padx=(0, 6))
+
+    def _bulk_edit_apply(self, rows: List[tuple]) -> None:
+        try:
+            updated, skipped = apply_bulk_edit(self.files_data, rows)
+        except Exception as e:
+            messagebox.showerror("Lỗi", f"Không thể áp dụng: {e}")
+            return
+        self._store_updated_members(updated)
+        self.status.set(f"Sửa theo path xong: {len(rows) - len(skipped)} hàng trong {len(updated)} tệp JSON")
+        if skipped:
+            messagebox.showwarning("Cảnh báo", "Các hàng sau đã đổi sau khi xem trước nên được bỏ qua:\n"
+                                   f"{format_problems(skipped)}")
+        # refresh current view if current file is JSON
+        if self.current_file in updated:
+            self._show_json(self.files_data[self.current_file])
+
     # ------------------------- Find & Replace across JSON -------------------------
     def _find_replace_all_json(self) -> None:
         needle = self.find_text.get()
@@ -710,7 +1645,7 @@ class VsixEditorApp:
             else:
                 return obj
 
-        updated_files = 0
+        updated = {}
         for name in list(self.files_data.keys()):
             if not is_json_like(name):
                 continue
@@ -721,21 +1656,97 @@ class VsixEditorApp:
             before_changes = count_changes
             obj2 = replace_in_obj(obj)
             if count_changes > before_changes:
-                self.files_data[name] = json.dumps(obj2, ensure_ascii=False, indent=2).encode("utf-8")
-                updated_files += 1
+                updated[name] = json.dumps(obj2, ensure_ascii=False, indent=2).encode("utf-8")
 
-        self.status.set(f"Tìm & Thay xong: {count_changes} thay đổi trong {updated_files} tệp JSON")
+        self._store_updated_members(updated)
+        self.status.set(f"Tìm & Thay xong: {count_changes} thay đổi trong {len(updated)} tệp JSON")
         # refresh current view if current file is JSON
         if self.current_file and is_json_like(self.current_file):
             self._show_json(self.files_data[self.current_file])
 
 
-def main():
+def _measure_startup(root: Tk, app: VsixEditorApp, budget: Optional[float]) -> int:
+    """In thời gian khởi động (tính từ lúc nạp module) rồi đóng cửa sổ.
+
+    - window: đã dựng khung cửa sổ (chưa xử lý sự kiện vẽ)
+    - ready:  cửa sổ đã hiện và vẽ, tab đang hiển thị đã dựng xong (so với budget)
+    - loaded: VSIX truyền qua dòng lệnh đã nạp xong (nếu có)
+    """
+    root.update_idletasks()
+    t_window = time.perf_counter() - _T_START
+    deadline = time.perf_counter() + 10
+    root.update()
+    while not (root.winfo_viewable() and "json" in app._tabs_built) and time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.002)
+    root.update()  # xử lý Expose: vẽ nội dung tab vừa dựng
+    t_ready = time.perf_counter() - _T_START
+    deadline = time.perf_counter() + 10
+    while app._pending_load is not None and time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.002)
+    loaded = app._pending_load is None
+    t_loaded = time.perf_counter() - _T_START
+    loaded_text = f"{t_loaded * 1000:.1f} ms" if loaded else "timeout"
+    print(f"startup: window={t_window * 1000:.1f} ms, ready={t_ready * 1000:.1f} ms, "
+          f"loaded={loaded_text}, customtkinter={'yes' if ctk is not None else 'no'}")
+    root.destroy()
+    if not loaded:
+        print("startup: nạp VSIX quá thời gian chờ", file=sys.stderr)
+        return 1
+    if budget is not None and t_ready > budget:
+        print(f"startup: vượt ngưỡng {budget * 1000:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="VSIX Editor")
+    parser.add_argument("path", nargs="?",
+                        help="tệp .vsix (hoặc thư mục đã giải nén, sẽ được theo dõi) cần mở ngay khi khởi động")
+    parser.add_argument("--out", metavar="VSIX",
+                        help="khi mở thư mục: tự build lại VSIX này mỗi khi thư mục thay đổi")
+    parser.add_argument("--watch", metavar="THU_MUC",
+                        help="chạy không giao diện: theo dõi thư mục và build lại --out khi có thay đổi")
+    parser.add_argument("--verify", metavar="VSIX",
+                        help="chạy không giao diện: kiểm tra toàn vẹn/nhất quán VSIX, thoát mã 1 nếu có vấn đề")
+    parser.add_argument("--once", action="store_true", help="dùng kèm --watch: build một lần rồi thoát")
+    parser.add_argument("--interval", type=float, default=1.0, metavar="GIAY",
+                        help="dùng kèm --watch: chu kỳ quét thư mục (mặc định 1 giây)")
+    parser.add_argument("--lazy", action="store_true",
+                        help="khởi động nhanh: dùng ttk (không import customtkinter), dựng tab khi hiển thị lần đầu")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="đo thời gian khởi động, in kết quả rồi thoát")
+    parser.add_argument("--startup-budget", type=float, metavar="GIAY",
+                        help="dùng kèm --startup-time: thoát mã 1 nếu mốc ready vượt ngưỡng")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        t0 = time.perf_counter()
+        problems = verify_vsix(args.verify)
+        for p in problems:
+            print(p)
+        print(f"verify: {len(problems)} vấn đề — {(time.perf_counter() - t0) * 1000:.0f} ms")
+        return 1 if problems else 0
+
+    if args.watch:
+        if not args.out:
+            parser.error("--watch cần --out")
+        try:
+            watch_vsix_dir(args.watch, args.out, interval=args.interval, once=args.once)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
     root = Tk()
     root.geometry("1100x720")
-    app = VsixEditorApp(root)
+    app = VsixEditorApp(root, initial_path=args.path, lazy=args.lazy, watch_out=args.out,
+                        show_dialogs=not args.startup_time)
+    if args.startup_time:
+        return _measure_startup(root, app, args.startup_budget)
     root.mainloop()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())